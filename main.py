@@ -5,12 +5,45 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                             QFrame, QScrollArea, QComboBox, QSizePolicy, QShortcut,
                             QCheckBox, QColorDialog, QMessageBox)
-from PyQt5.QtGui import QPixmap, QImage, QKeySequence, QPainter, QColor, QPen, QBrush, QIntValidator
-from PyQt5.QtCore import Qt, QRect, QPoint
-from PIL import Image, ImageDraw
-import shutil
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage, QKeySequence, QPainter, QColor, QPen, QBrush, QIntValidator
+from PyQt5.QtCore import (Qt, QRect, QRectF, QPoint, QSize, QTimer, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from bisect import bisect_left
+from collections import defaultdict
 from pathlib import Path
 
+try:
+    import orjson  # Optional, parses JSON several times faster than the json module
+except ImportError:
+    orjson = None
+
+def add_unique(sorted_values, value):
+    """Insert value into a sorted list unless it is already there; return its index, or None"""
+    index = bisect_left(sorted_values, value)
+    if index < len(sorted_values) and sorted_values[index] == value:
+        return None
+    sorted_values.insert(index, value)
+    return index
+
+def contains_sorted(sorted_values, value):
+    """Check whether value is in a sorted list using binary search"""
+    index = bisect_left(sorted_values, value)
+    return index < len(sorted_values) and sorted_values[index] == value
+
+def load_json(path):
+    """Load a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def to_native_format(image):
+    """Convert an image to the paint engine's native 32-bit format, if it isn't already"""
+    native_format = (QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel()
+                     else QImage.Format_RGB32)
+    if image.format() != native_format:
+        image = image.convertToFormat(native_format)
+    return image
+
 class DrawableImageLabel(QLabel):
     """Custom QLabel that allows drawing rectangles on the image"""
     
@@ -25,12 +58,28 @@ class DrawableImageLabel(QLabel):
         self.end_point = QPoint()
         self.boxes = []  # List of QRect objects
         self.boxes_visible = True  # Whether to display the boxes
-        self.current_scale = 1.0  # Current display scale
+        self.current_scale = 1.0  # Current display scale (also sets _inv_scale)
         self.original_boxes = []  # Original box coordinates at 100% scale
+        self.source_pixmap = None  # Full-size pixmap painted at current_scale (high zoom only)
+        self._scaled_for = None  # (scale, x offset, y offset, box count) self.boxes were built for
         
         # Appearance
         self.box_color = QColor(255, 0, 0, 128)  # Semi-transparent red
-        
+        # Build the pen and brush once instead of for every box on every repaint
+        self.box_pen = QPen(self.box_color, 2)
+        self.box_brush = QBrush(self.box_color)
+        
+    @property
+    def current_scale(self):
+        """Current display scale"""
+        return self._current_scale
+    
+    @current_scale.setter
+    def current_scale(self, scale):
+        # Keep the reciprocal so paintEvent can multiply instead of divide
+        self._current_scale = scale
+        self._inv_scale = 1.0 / scale if scale else 1.0
+    
     def enable_drawing(self, enabled):
         """Enable or disable drawing mode"""
         self.drawing_enabled = enabled
@@ -50,18 +99,40 @@ class DrawableImageLabel(QLabel):
                 self.original_boxes.append((int(x), int(y), int(width), int(height)))
         
         # Apply current scale to boxes
+        self._scaled_for = None
         self._update_scaled_boxes()
         
         # Force a repaint to show the boxes
         self.update()
     
+    def set_source_pixmap(self, pixmap):
+        """Paint a full-size pixmap at current_scale, drawing only the exposed region
+        
+        Used at high zoom so the whole map never has to be scaled up in memory.
+        Pass None to go back to showing the label's own pixmap.
+        """
+        self.source_pixmap = pixmap
+        if pixmap is not None:
+            self.clear()
+        self.update()
+    
+    def display_size(self):
+        """Get the size of the image as displayed in the label"""
+        if self.source_pixmap is not None:
+            return QSize(int(self.source_pixmap.width() * self.current_scale),
+                         int(self.source_pixmap.height() * self.current_scale))
+        if self.pixmap():
+            return self.pixmap().size()
+        return QSize()
+    
     def _get_image_offset(self):
         """Calculate the offset of the image within the label"""
-        if not self.pixmap():
+        display_size = self.display_size()
+        if display_size.isEmpty():
             return 0, 0
             
-        pixmap_width = self.pixmap().width()
-        pixmap_height = self.pixmap().height()
+        pixmap_width = display_size.width()
+        pixmap_height = display_size.height()
         label_width = self.width()
         label_height = self.height()
         
@@ -103,29 +174,27 @@ class DrawableImageLabel(QLabel):
     
     def _update_scaled_boxes(self):
         """Update the boxes based on the current scale"""
-        self.boxes = []
-        
-        if not self.pixmap():
+        if self.display_size().isEmpty():
+            self.boxes = []
+            self._scaled_for = None
             return
             
         x_offset, y_offset = self._get_image_offset()
         
-        for x, y, width, height in self.original_boxes:
-            # Apply current scale to box coordinates
-            scaled_x = int(x * self.current_scale)
-            scaled_y = int(y * self.current_scale)
-            scaled_width = int(width * self.current_scale)
-            scaled_height = int(height * self.current_scale)
-            
-            # Add the offset to position correctly within the label
-            scaled_x += x_offset
-            scaled_y += y_offset
-            
-            # Create a QRect with the scaled dimensions
-            rect = QRect(scaled_x, scaled_y, scaled_width, scaled_height)
-            # Only add if it has a reasonable size
-            if rect.width() > 0 and rect.height() > 0:
-                self.boxes.append(rect)
+        # Nothing to do if the boxes were already built for this scale and position
+        scaled_for = (self.current_scale, x_offset, y_offset, len(self.original_boxes))
+        if scaled_for == self._scaled_for and len(self.boxes) == len(self.original_boxes):
+            return
+        self._scaled_for = scaled_for
+        
+        # Scale every box in one pass, offsetting it to its position within the label
+        scale = self.current_scale
+        scaled_boxes = ((int(x * scale) + x_offset, int(y * scale) + y_offset,
+                         int(width * scale), int(height * scale))
+                        for x, y, width, height in self.original_boxes)
+        # Only keep boxes that still have a visible size, without building a QRect for the rest
+        self.boxes = [QRect(x, y, width, height) for x, y, width, height in scaled_boxes
+                      if width > 0 and height > 0]
     
     def get_boxes(self):
         """Get the list of boxes as serializable data (at original scale)"""
@@ -145,20 +214,30 @@ class DrawableImageLabel(QLabel):
             self.original_boxes.pop()
             self.update()
     
+    def _drawing_rect_bounds(self, end_point=None):
+        """Get the area covered by the rectangle being drawn, including its pen"""
+        if end_point is None:
+            end_point = self.end_point
+        return QRect(self.start_point, end_point).normalized().adjusted(-3, -3, 3, 3)
+    
     def mousePressEvent(self, event):
         """Handle mouse press events for drawing"""
         if self.drawing_enabled and event.button() == Qt.LeftButton:
             self.drawing = True
             self.start_point = event.pos()
             self.end_point = event.pos()
-            self.update()
+            self.update(self._drawing_rect_bounds())
         super().mousePressEvent(event)
     
     def mouseMoveEvent(self, event):
         """Handle mouse move events for drawing"""
-        if self.drawing_enabled and self.drawing:
+        # Only repaint when the rectangle being drawn actually changed, and only the area
+        # covered by its old and new outline
+        if self.drawing_enabled and self.drawing and event.pos() != self.end_point:
+            dirty = self._drawing_rect_bounds().united(
+                self._drawing_rect_bounds(event.pos()))
             self.end_point = event.pos()
-            self.update()
+            self.update(dirty)
         super().mouseMoveEvent(event)
     
     def mouseReleaseEvent(self, event):
@@ -189,31 +268,167 @@ class DrawableImageLabel(QLabel):
                     orig_height
                 ))
             
-            self.update()
+            self.update(self._drawing_rect_bounds())
         super().mouseReleaseEvent(event)
     
     def paintEvent(self, event):
         """Paint the image and the rectangles"""
         super().paintEvent(event)
         
-        if self.pixmap() and self.boxes_visible:
+        if self.source_pixmap is not None:
+            # Scale only the exposed part of the source image onto the label
+            x_offset, y_offset = self._get_image_offset()
+            display_size = self.display_size()
+            target = event.rect().intersected(
+                QRect(x_offset, y_offset, display_size.width(), display_size.height()))
+            if not target.isEmpty():
+                inv_scale = self._inv_scale
+                source = QRectF((target.x() - x_offset) * inv_scale,
+                                (target.y() - y_offset) * inv_scale,
+                                target.width() * inv_scale,
+                                target.height() * inv_scale)
+                painter = QPainter(self)
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.drawPixmap(QRectF(target), self.source_pixmap, source)
+                painter.end()
+        
+        # Skip creating a painter when there are no boxes to draw
+        drawing_rect = self.drawing_enabled and self.drawing
+        if not (self.boxes or drawing_rect):
+            return
+        
+        if not self.display_size().isEmpty() and self.boxes_visible:
             painter = QPainter(self)
+            painter.setPen(self.box_pen)
+            painter.setBrush(self.box_brush)
             
-            # Draw existing boxes
-            for rect in self.boxes:
-                painter.setPen(QPen(self.box_color, 2))
-                painter.setBrush(QBrush(self.box_color))
-                painter.drawRect(rect)
+            # Draw existing boxes in a single call
+            if self.boxes:
+                painter.drawRects(self.boxes)
             
             # Draw the rectangle being created
-            if self.drawing_enabled and self.drawing:
-                painter.setPen(QPen(self.box_color, 2))
-                painter.setBrush(QBrush(self.box_color))
+            if drawing_rect:
                 rect = QRect(self.start_point, self.end_point).normalized()
                 painter.drawRect(rect)
             
             painter.end()
 
+class ImageLoaderSignals(QObject):
+    """Signals emitted by ImageLoader (QRunnable cannot emit signals itself)"""
+    loaded = pyqtSignal(str, QImage, QImage)
+
+class ImageLoader(QRunnable):
+    """Decode an image and a copy fitted to the viewport off the GUI thread"""
+    
+    def __init__(self, image_path, viewport_size):
+        super().__init__()
+        self.image_path = image_path
+        self.viewport_size = viewport_size
+        self.signals = ImageLoaderSignals()
+        self.started = False  # Set once a pool thread picks the loader up
+    
+    def run(self):
+        """Decode the image and emit it with its viewport-fitted copy"""
+        self.started = True
+        image = QImage(self.image_path)
+        fitted_image = QImage()
+        
+        # Convert to the paint engine's native format here, off the GUI thread, so neither
+        # QPixmap.fromImage nor the smooth scaling below has to convert it again
+        if not image.isNull():
+            image = to_native_format(image)
+        
+        # Only scale down to fit the viewport, never scale up small images
+        if not image.isNull() and (image.width() > self.viewport_size.width() or
+                                   image.height() > self.viewport_size.height()):
+            fitted_image = image.scaled(self.viewport_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        
+        self.signals.loaded.emit(self.image_path, image, fitted_image)
+
+class RedactTaskSignals(QObject):
+    """Signals emitted by RedactTask (QRunnable cannot emit signals itself)"""
+    finished = pyqtSignal(str, QImage, str)  # Redacted image path, new image (null if none), error message
+
+class RedactTask(QRunnable):
+    """Write the redacted copy of an image off the GUI thread, or remove it when there are no boxes"""
+    
+    # PNG quality for QImage.save; Qt maps 80 to zlib level 1, since encoding dominates save time
+    PNG_QUALITY = 80
+    
+    def __init__(self, original_image_path, redacted_image_path, boxes, image=None):
+        super().__init__()
+        self.original_image_path = str(original_image_path)
+        self.redacted_image_path = str(redacted_image_path)
+        # Copy the boxes; the label keeps editing its own list while this runs
+        self.boxes = [tuple(box) for box in boxes]
+        # Already decoded original, if available (QImage is implicitly shared, so this is cheap)
+        self.image = image
+        self.signals = RedactTaskSignals()
+    
+    def run(self):
+        """Black out the boxes and save the result, emitting finished either way"""
+        redacted_image = QImage()
+        try:
+            if self.boxes:
+                redacted_image = self.redact()
+            else:
+                try:
+                    os.remove(self.redacted_image_path)
+                except FileNotFoundError:
+                    pass
+        except Exception as e:
+            self.signals.finished.emit(self.redacted_image_path, QImage(), str(e))
+            return
+        self.signals.finished.emit(self.redacted_image_path, redacted_image, "")
+    
+    def redact(self):
+        """Draw the boxes over the original image, save it as the redacted image and return it"""
+        # Reuse the image decoded for display instead of decoding the PNG again
+        image = self.image
+        if image is None or image.isNull():
+            image = QImage(self.original_image_path)
+            if image.isNull():
+                raise IOError(f"Could not load image: {self.original_image_path}")
+        
+        # QPainter can't paint on indexed, mono or greyscale PNGs, so convert them first;
+        # an image that is already native is copied since the cached one may still be on screen
+        native_image = to_native_format(image)
+        image = native_image.copy() if native_image is image else native_image
+        
+        painter = QPainter(image)
+        if not painter.isActive():
+            raise IOError(f"Could not paint on image: {self.original_image_path}")
+        
+        # Draw filled rectangles for each box
+        for box in self.boxes:
+            x, y, width, height = box
+            # Ensure coordinates are within image bounds
+            x = max(0, min(x, image.width() - 1))
+            y = max(0, min(y, image.height() - 1))
+            # Ensure width and height don't exceed image bounds
+            width = min(width, image.width() - x)
+            height = min(height, image.height() - y)
+            # Fill the rectangle, including its right and bottom edges
+            painter.fillRect(x, y, width + 1, height + 1, Qt.black)
+        
+        painter.end()
+        
+        # Save the redacted image next to the final path and swap it in atomically, so the
+        # viewer and copy_ski_data.sh never see a half-written PNG
+        tmp_path = self.redacted_image_path + ".tmp"
+        try:
+            if not image.save(tmp_path, "PNG", self.PNG_QUALITY):
+                raise IOError(f"Could not write image: {self.redacted_image_path}")
+            os.replace(tmp_path, self.redacted_image_path)
+        except Exception:
+            # Don't leave a partial temp file behind in the resort folder
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return image
+
 class SkiMapProcessor(QMainWindow):
     def __init__(self, files_dir="files"):
         super().__init__()
@@ -222,18 +437,50 @@ class SkiMapProcessor(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         
         self.files_dir = files_dir
-        self.folders = self.get_folders()
+        
+        # Parsed metadata keyed by folder name, kept in sync with disk on save
+        self._metadata_cache = {}
+        
+        self._set_folders(self.get_folders())
         self.current_folder_index = 0
         
         # Image display variables
         self.current_zoom = 1.0  # Current zoom level
         self.zoom_step = 0.1     # Zoom step size
         
-        # Collect unique metadata values from existing files
-        self.unique_values = self.collect_unique_metadata_values()
+        # Keep recently scaled pixmaps around so zooming back and forth is cheap
+        QPixmapCache.setCacheLimit(128 * 1024)  # In KiB
+        
+        # Decoded images of the current and neighbouring folders, keyed by image path
+        self._image_cache = {}
+        self._pending_image_loads = {}  # Image path -> ImageLoader
+        
+        # Images are decoded on a pool of our own: Qt's global pool also runs the GUI thread's
+        # smooth scaling, which would deadlock waiting for the GIL held by a loader
+        self._load_pool = QThreadPool(self)
+        
+        # Decoded redacted image of the current folder, so toggling the view doesn't reload it
+        self._redacted_image_cache = {}
         
-        # Create a mapping of country to regions
-        self.country_to_regions = self.create_country_region_mapping()
+        # Zoom steps show a fast preview first, then re-render smoothly once zooming pauses
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(120)
+        self._smooth_timer.timeout.connect(self._rerender_smooth)
+        
+        # Ctrl+wheel deltas are coalesced and applied at most once per frame (~60 Hz)
+        self._wheel_accum = 0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)
+        self._wheel_timer.timeout.connect(self._apply_wheel_zoom)
+        
+        # Redacted images are written one at a time, in save order, so a later save always wins
+        self._redact_pool = QThreadPool(self)
+        self._redact_pool.setMaxThreadCount(1)
+        
+        # Collect unique metadata values and the country-to-region mapping in one pass
+        self.unique_values, self.country_to_regions = self._scan_metadata()
         
         # Main widget and layout
         main_widget = QWidget()
@@ -447,63 +694,81 @@ class SkiMapProcessor(QMainWindow):
             # Create or update the index.json file
             self.update_index_json()
     
-    def collect_unique_metadata_values(self):
-        """Collect unique values for each metadata field from all metadata.json files"""
-        unique_values = {
-            "name": set(),
-            "country": set(),
-            "region": set(),
-            "parent_company": set(),
-            "continent": set()  # Add continent to unique values
-        }
+    def _load_metadata(self, folders):
+        """Parse every folder's metadata.json into self._metadata_cache.
+        
+        Parsed metadata is cached in files/.metadata_index.json keyed by each file's mtime,
+        so only metadata.json files that changed since the last launch are parsed again.
+        """
+        index_path = os.path.join(self.files_dir, ".metadata_index.json")
+        cached_index = {}
+        try:
+            cached_index = load_json(index_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error reading metadata index from {index_path}: {e}")
+        if not isinstance(cached_index, dict):
+            print(f"Error reading metadata index from {index_path}: not a JSON object")
+            cached_index = {}
         
-        for folder in self.folders:
+        metadata_index = {}
+        for folder in folders:
             metadata_path = os.path.join(self.files_dir, folder, "metadata.json")
-            if os.path.exists(metadata_path):
+            try:
+                mtime_ns = os.stat(metadata_path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            
+            cached = cached_index.get(folder)
+            if isinstance(cached, dict) and cached.get("mtime_ns") == mtime_ns:
+                metadata = cached.get("metadata")
+            else:
                 try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                    
-                    # Add non-empty values to sets
-                    if metadata.get("name"):
-                        unique_values["name"].add(metadata["name"])
-                    if metadata.get("country"):
-                        unique_values["country"].add(metadata["country"])
-                    if metadata.get("region"):
-                        unique_values["region"].add(metadata["region"])
-                    if metadata.get("parent_company"):
-                        unique_values["parent_company"].add(metadata["parent_company"])
-                    if metadata.get("continent"):
-                        unique_values["continent"].add(metadata["continent"])
+                    metadata = load_json(metadata_path)
                 except Exception as e:
                     print(f"Error reading metadata from {metadata_path}: {e}")
-        
-        # Convert sets to sorted lists
-        return {k: sorted(list(v)) for k, v in unique_values.items()}
+                    continue
+            if not isinstance(metadata, dict):
+                print(f"Error reading metadata from {metadata_path}: not a JSON object")
+                continue
+            metadata_index[folder] = {"mtime_ns": mtime_ns, "metadata": metadata}
+            self._metadata_cache[folder] = metadata
+        
+        # Write the index back atomically, but only if something changed
+        if metadata_index != cached_index:
+            try:
+                tmp_path = index_path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    if orjson:
+                        f.write(orjson.dumps(metadata_index))
+                    else:
+                        f.write(json.dumps(metadata_index).encode())
+                os.replace(tmp_path, index_path)
+            except Exception as e:
+                print(f"Error writing metadata index to {index_path}: {e}")
     
-    def create_country_region_mapping(self):
-        """Create a mapping of countries to their regions"""
-        country_to_regions = {}
-        
-        for folder in self.folders:
-            metadata_path = os.path.join(self.files_dir, folder, "metadata.json")
-            if os.path.exists(metadata_path):
-                try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                    
-                    country = metadata.get("country")
-                    region = metadata.get("region")
-                    
-                    if country and region:
-                        if country not in country_to_regions:
-                            country_to_regions[country] = set()
-                        country_to_regions[country].add(region)
-                except Exception as e:
-                    print(f"Error reading metadata from {metadata_path}: {e}")
+    def _scan_metadata(self):
+        """Collect unique metadata values and the country-to-region mapping in a single pass"""
+        unique_keys = ("name", "country", "region", "parent_company", "continent")
+        unique_values = {key: set() for key in unique_keys}
+        country_to_regions = defaultdict(set)
+        
+        for metadata in self._metadata_cache.values():
+            # Add non-empty values to sets
+            for key in unique_keys:
+                value = metadata.get(key)
+                if value:
+                    unique_values[key].add(value)
+            
+            country = metadata.get("country")
+            region = metadata.get("region")
+            if country and region:
+                country_to_regions[country].add(region)
         
         # Convert sets to sorted lists
-        return {k: sorted(list(v)) for k, v in country_to_regions.items()}
+        return ({k: sorted(v) for k, v in unique_values.items()},
+                {k: sorted(v) for k, v in country_to_regions.items()})
     
     def on_country_changed(self, text):
         """Handle country dropdown change"""
@@ -517,12 +782,16 @@ class SkiMapProcessor(QMainWindow):
             self.country_input.setVisible(False)
             
             # Update region dropdown based on selected country
-            self.region_combo.clear()
-            if text in self.country_to_regions:
-                self.region_combo.setEnabled(True)
-                self.region_combo.addItems([""] + self.country_to_regions[text] + ["Other"])
-            else:
-                self.region_combo.setEnabled(False)
+            self.populate_regions(text)
+    
+    def populate_regions(self, country):
+        """Fill the region dropdown with the known regions of the given country"""
+        self.region_combo.clear()
+        if country in self.country_to_regions:
+            self.region_combo.setEnabled(True)
+            self.region_combo.addItems([""] + self.country_to_regions[country] + ["Other"])
+        else:
+            self.region_combo.setEnabled(False)
     
     def on_region_changed(self, text):
         """Handle region dropdown change"""
@@ -563,41 +832,47 @@ class SkiMapProcessor(QMainWindow):
     
     def get_folders(self):
         """Get all folders in the files directory"""
-        if not os.path.exists(self.files_dir):
+        # scandir exposes the entry type without an extra stat() per folder
+        try:
+            with os.scandir(self.files_dir) as entries:
+                current_folders = [entry.name for entry in entries
+                        if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
             return []
         
-        current_folders = [f for f in os.listdir(self.files_dir) 
-                if os.path.isdir(os.path.join(self.files_dir, f))]
+        # Read every folder's metadata once; sorting and the combo boxes both use the cache
+        self._load_metadata(current_folders)
         
         # Check if the list of folders has changed
         if hasattr(self, 'folders') and set(current_folders) != set(self.folders):
-            # Update the folders attribute
-            self.folders = current_folders
+            # Update the folders attribute (and the per-folder paths with it)
+            folders = self.sort_folders_by_name(current_folders)
+            self._set_folders(folders)
             # Update the index.json file
             self.update_index_json()
-            return self.sort_folders_by_name(current_folders)
+            return folders
         
         return self.sort_folders_by_name(current_folders)
     
+    def _set_folders(self, folders):
+        """Set the folder list and rebuild the per-folder paths that parallel it"""
+        self.folders = folders
+        
+        # Per-folder paths, built once instead of joined on every load and save
+        self.folder_paths = [Path(self.files_dir) / folder for folder in self.folders]
+        self.metadata_paths = [path / "metadata.json" for path in self.folder_paths]
+        self.original_image_paths = [path / "ski_map_original.png" for path in self.folder_paths]
+        self.redacted_image_paths = [path / "ski_map_redacted.png" for path in self.folder_paths]
+    
     def sort_folders_by_name(self, folders):
         """Sort folders based on the resort names in their metadata files"""
         # Create a dictionary to map folders to their resort names
         folder_to_name = {}
         
         for folder in folders:
-            metadata_path = os.path.join(self.files_dir, folder, "metadata.json")
-            if os.path.exists(metadata_path):
-                try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                    
-                    # Use the resort name if available, otherwise use the folder name
-                    folder_to_name[folder] = metadata.get("name", folder).lower()
-                except Exception as e:
-                    print(f"Error reading metadata from {metadata_path}: {e}")
-                    folder_to_name[folder] = folder.lower()
-            else:
-                folder_to_name[folder] = folder.lower()
+            # Use the resort name if available, otherwise use the folder name
+            name = self._metadata_cache.get(folder, {}).get("name", folder)
+            folder_to_name[folder] = name.lower() if isinstance(name, str) else folder.lower()
         
         # Sort folders based on their associated names
         return sorted(folders, key=lambda folder: folder_to_name.get(folder, folder.lower()))
@@ -608,7 +883,7 @@ class SkiMapProcessor(QMainWindow):
             return
         
         current_folder = self.folders[self.current_folder_index]
-        folder_path = os.path.join(self.files_dir, current_folder)
+        folder_path = self.folder_paths[self.current_folder_index]
         
         # Update folder label
         self.folder_label.setText(f"Folder: {current_folder} ({self.current_folder_index + 1}/{len(self.folders)})")
@@ -621,32 +896,98 @@ class SkiMapProcessor(QMainWindow):
         self.view_toggle_btn.setText("View Redacted")
         
         # Store paths for later use
-        self.current_folder_path = folder_path
-        self.original_image_path = os.path.join(folder_path, "ski_map_original.png")
-        self.redacted_image_path = os.path.join(folder_path, "ski_map_redacted.png")
+        self.current_folder_path = str(folder_path)
+        self.original_image_path = str(self.original_image_paths[self.current_folder_index])
+        self.redacted_image_path = str(self.redacted_image_paths[self.current_folder_index])
+        self._redacted_image_cache = {path: image for path, image in self._redacted_image_cache.items()
+                                      if path == self.redacted_image_path}
         
         # Load metadata first to get boxes
-        metadata_path = os.path.join(folder_path, "metadata.json")
-        if os.path.exists(metadata_path):
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+        metadata_path = self.metadata_paths[self.current_folder_index]
+        metadata = self._metadata_cache.get(self.folders[self.current_folder_index])
+        if metadata is None:
+            try:
+                metadata = load_json(metadata_path)
+            except FileNotFoundError:
+                pass
+            if metadata is not None and not isinstance(metadata, dict):
+                print(f"Error reading metadata from {metadata_path}: not a JSON object")
+                metadata = None
+            if metadata is not None:
+                self._metadata_cache[self.folders[self.current_folder_index]] = metadata
+        
+        # Fill the form with the combo signals blocked; otherwise every setCurrentText would
+        # run its change handler and rebuild the region list along the way
+        form_combos = (self.country_combo, self.region_combo, self.company_combo, self.continent_combo)
+        for combo in form_combos:
+            combo.blockSignals(True)
+        try:
+            self._fill_form(metadata)
+        finally:
+            # Unblock even if the metadata was malformed, or the form would stop reacting
+            for combo in form_combos:
+                combo.blockSignals(False)
+        
+        # Hand the saved boxes to the label now, not once the image is shown, so toggling the
+        # view or saving while the image is still loading keeps them
+        self.image_label.set_boxes(self.current_boxes)
+        
+        # Wheel movement left over from the previous map must not zoom this one
+        self._wheel_accum = 0
+        self._wheel_timer.stop()
+        
+        # Loads still queued for the previous neighbourhood would only delay this one
+        self._cancel_queued_image_loads()
+        
+        # Now load the image
+        if os.path.exists(self.original_image_path):
+            # Reset zoom level when loading a new image
+            self.current_zoom = 1.0
+            self.zoom_reset_btn.setText("100%")
             
+            # Decode the image off the GUI thread so rapid navigation stays responsive;
+            # the old pixmap is dropped so zooming waits for the new image
+            self.original_pixmap = QPixmap()
+            cached = self._image_cache.get(self.original_image_path)
+            if cached:
+                # Already prefetched while the user was looking at a neighbouring folder
+                self._show_loaded_image(self.original_image_path, *cached)
+            else:
+                self.image_label.set_source_pixmap(None)
+                self.image_label.setText("Loading...")
+                self.statusBar().showMessage(f"Loading folder: {current_folder}")
+                self._request_image(self.original_image_path)
+            
+            # Enable/disable view toggle based on whether redacted image exists
+            self.view_toggle_btn.setEnabled(os.path.exists(self.redacted_image_path))
+        else:
+            self.image_label.setText(f"Image not found: {self.original_image_path}")
+            self.statusBar().showMessage(f"Error: Image not found in {current_folder}")
+            self.view_toggle_btn.setEnabled(False)
+    
+    def _fill_form(self, metadata):
+        """Fill the form fields and current boxes from a folder's metadata (None clears them)"""
+        if metadata is not None:
             # Set form values
             self.name_input.setText(metadata.get("name", ""))
             
             # Set country
-            country = metadata.get("country", "")
-            if country in self.unique_values["country"]:
+            # Values are looked up by binary search in the sorted lists (null counts as empty)
+            country = metadata.get("country") or ""
+            if contains_sorted(self.unique_values["country"], country):
                 self.country_combo.setCurrentText(country)
                 self.country_input.setVisible(False)
+                self.populate_regions(country)
             else:
                 self.country_combo.setCurrentText("Other")
                 self.country_input.setText(country)
                 self.country_input.setVisible(True)
+                self.region_combo.setEnabled(False)
+                self.region_combo.clear()
             
-            # Set region (will be updated by country change handler)
-            region = metadata.get("region", "")
-            if country in self.country_to_regions and region in self.country_to_regions[country]:
+            # Set region
+            region = metadata.get("region") or ""
+            if contains_sorted(self.country_to_regions.get(country, []), region):
                 self.region_combo.setCurrentText(region)
                 self.region_input.setVisible(False)
             else:
@@ -655,8 +996,8 @@ class SkiMapProcessor(QMainWindow):
                 self.region_input.setVisible(True)
             
             # Set company
-            company = metadata.get("parent_company", "")
-            if company in self.unique_values["parent_company"]:
+            company = metadata.get("parent_company") or ""
+            if contains_sorted(self.unique_values["parent_company"], company):
                 self.company_combo.setCurrentText(company)
                 self.company_input.setVisible(False)
             else:
@@ -665,8 +1006,8 @@ class SkiMapProcessor(QMainWindow):
                 self.company_input.setVisible(True)
             
             # Set continent
-            continent = metadata.get("continent", "")
-            if continent in self.unique_values["continent"]:
+            continent = metadata.get("continent") or ""
+            if contains_sorted(self.unique_values["continent"], continent):
                 self.continent_combo.setCurrentText(continent)
                 self.continent_input.setVisible(False)
             else:
@@ -694,6 +1035,7 @@ class SkiMapProcessor(QMainWindow):
             self.country_combo.setCurrentText("")
             self.country_input.setText("")
             self.country_input.setVisible(False)
+            self.populate_regions("")
             self.region_combo.setCurrentText("")
             self.region_input.setText("")
             self.region_input.setVisible(False)
@@ -708,45 +1050,97 @@ class SkiMapProcessor(QMainWindow):
             self.latitude_input.setText("")
             self.longitude_input.setText("")
             self.current_boxes = []
+    
+    def _neighbour_image_paths(self):
+        """Get the original image paths of the current, next and previous folders"""
+        count = len(self.folders)
+        return [str(self.original_image_paths[(self.current_folder_index + offset) % count])
+                for offset in (0, 1, -1)]
+    
+    def _request_image(self, image_path, priority=0):
+        """Start decoding an image in the background unless it is cached or already loading"""
+        if image_path in self._image_cache or image_path in self._pending_image_loads:
+            return
+        if not os.path.exists(image_path):
+            return
         
-        # Now load the image
-        if os.path.exists(self.original_image_path):
-            # Reset zoom level when loading a new image
-            self.current_zoom = 1.0
-            self.zoom_reset_btn.setText("100%")
-            
-            # Display the image with high quality
-            self.display_image(image_path=self.original_image_path)
-            
-            # After image is loaded, set the boxes with the current scale
-            if hasattr(self, 'current_boxes') and self.current_boxes:
-                self.image_label.set_boxes(self.current_boxes)
-                self.image_label.boxes_visible = True
-                self.image_label.current_scale = self.current_zoom
-                self.image_label._update_scaled_boxes()
-                self.image_label.update()  # Force a repaint
-                self.statusBar().showMessage(f"Loaded folder: {current_folder} | Image: ski_map_original.png | Boxes: {len(self.current_boxes)}")
-            else:
-                self.statusBar().showMessage(f"Loaded folder: {current_folder} | Image: ski_map_original.png")
-            
-            # Enable/disable view toggle based on whether redacted image exists
-            self.view_toggle_btn.setEnabled(os.path.exists(self.redacted_image_path))
+        loader = ImageLoader(image_path, self.image_scroll.viewport().size())
+        loader.signals.loaded.connect(self._on_image_loaded)
+        self._pending_image_loads[image_path] = loader
+        self._load_pool.start(loader, priority)
+    
+    def _cancel_queued_image_loads(self):
+        """Drop image loads that haven't started yet; they are for folders the user has left"""
+        self._load_pool.clear()
+        # Cleared loaders never run, so only the ones already running are still pending
+        self._pending_image_loads = {path: loader for path, loader in self._pending_image_loads.items()
+                                     if loader.started}
+    
+    def _prefetch_neighbours(self):
+        """Drop cached images that are no longer adjacent and prefetch the adjacent ones"""
+        neighbour_paths = self._neighbour_image_paths()
+        for path in list(self._image_cache):
+            if path not in neighbour_paths:
+                del self._image_cache[path]
+        
+        for path in neighbour_paths[1:]:
+            self._request_image(path, priority=-1)
+    
+    def _on_image_loaded(self, image_path, image, fitted_image):
+        """Cache an image decoded by ImageLoader and show it if it is still the current one"""
+        self._pending_image_loads.pop(image_path, None)
+        fitted_image = None if fitted_image.isNull() else fitted_image
+        
+        if not image.isNull() and image_path in self._neighbour_image_paths():
+            self._image_cache[image_path] = (image, fitted_image)
+        
+        if image_path == self.original_image_path and not self.view_toggle_btn.isChecked():
+            self._show_loaded_image(image_path, image, fitted_image)
+    
+    def _show_loaded_image(self, image_path, image, fitted_image):
+        """Show the current folder's decoded image along with its boxes"""
+        current_folder = self.folders[self.current_folder_index]
+        
+        # Display the image with high quality
+        self.display_image(image_path=image_path, image=image, fitted_image=fitted_image)
+        
+        # After image is loaded, scale the boxes (set in load_current_folder) to it
+        if self.current_boxes:
+            self.image_label.boxes_visible = True
+            self.image_label._update_scaled_boxes()
+            self.image_label.update()
+            self.statusBar().showMessage(f"Loaded folder: {current_folder} | Image: ski_map_original.png | Boxes: {len(self.current_boxes)}")
         else:
-            self.image_label.setText(f"Image not found: {self.original_image_path}")
-            self.statusBar().showMessage(f"Error: Image not found in {current_folder}")
-            self.view_toggle_btn.setEnabled(False)
+            self.statusBar().showMessage(f"Loaded folder: {current_folder} | Image: ski_map_original.png")
+        
+        # Warm up the folders the user is most likely to open next
+        self._prefetch_neighbours()
     
-    def display_image(self, image_path=None, pixmap=None):
-        """Display the image in the GUI with high quality"""
+    def display_image(self, image_path=None, pixmap=None, source_pixmap=None, image=None, fitted_image=None):
+        """Display the image in the GUI with high quality
+        
+        A source_pixmap is painted at the current zoom without being scaled up front.
+        An image_path may come with its already decoded image and viewport-fitted copy.
+        """
         try:
             if image_path:
-                # Open the image with PIL to get dimensions
-                pil_img = Image.open(image_path)
-                img_width, img_height = pil_img.size
+                # A pending smooth re-render belongs to the previous image
+                self._smooth_timer.stop()
                 
                 # Store original image for potential high-quality display
-                self.original_pixmap = QPixmap(image_path)
+                if image is not None:
+                    self.original_pixmap = QPixmap.fromImage(image)
+                else:
+                    self.original_pixmap = QPixmap(image_path)
+                if self.original_pixmap.isNull():
+                    raise IOError(f"Could not load image: {image_path}")
+                # Halved copies for zooming out are built on demand
+                self._pyramid = [self.original_pixmap]
+                img_width = self.original_pixmap.width()
+                img_height = self.original_pixmap.height()
                 self.current_image_path = image_path
+                # Key for cached scaled copies; the mtime changes whenever the file is rewritten
+                self.current_image_key = f"{image_path}:{os.path.getmtime(image_path)}"
                 self.current_zoom = 1.0  # Reset zoom when loading a new image
                 
                 # Store original dimensions for proper scaling
@@ -759,13 +1153,17 @@ class SkiMapProcessor(QMainWindow):
                 
                 # Determine if we need to scale down (never scale up small images)
                 if img_width > viewport_width or img_height > viewport_height:
-                    # Scale down to fit viewport while maintaining aspect ratio
-                    display_pixmap = self.original_pixmap.scaled(
-                        viewport_width, 
-                        viewport_height,
-                        Qt.KeepAspectRatio,  # Maintain aspect ratio
-                        Qt.SmoothTransformation  # High-quality scaling
-                    )
+                    if fitted_image is not None:
+                        # Already scaled down by ImageLoader
+                        display_pixmap = QPixmap.fromImage(fitted_image)
+                    else:
+                        # Scale down to fit viewport while maintaining aspect ratio
+                        display_pixmap = self.original_pixmap.scaled(
+                            viewport_width, 
+                            viewport_height,
+                            Qt.KeepAspectRatio,  # Maintain aspect ratio
+                            Qt.SmoothTransformation  # High-quality scaling
+                        )
                     
                     # Calculate the actual zoom level based on the scaling
                     if img_width > img_height:
@@ -797,20 +1195,28 @@ class SkiMapProcessor(QMainWindow):
                 display_pixmap = pixmap
                 # Update zoom indicator
                 self.zoom_reset_btn.setText(f"{int(self.current_zoom * 100)}%")
+            elif source_pixmap:
+                # Let the label paint the visible region (for high zoom levels)
+                display_pixmap = None
+                # Update zoom indicator
+                self.zoom_reset_btn.setText(f"{int(self.current_zoom * 100)}%")
             else:
                 return
             
-            # Set the pixmap to the label
-            self.image_label.setPixmap(display_pixmap)
-            
             # Store the current display scale for box scaling
             self.image_label.current_scale = self.current_zoom
             
+            # Set the pixmap to the label
+            if display_pixmap is not None:
+                self.image_label.set_source_pixmap(None)
+                self.image_label.setPixmap(display_pixmap)
+            else:
+                self.image_label.set_source_pixmap(source_pixmap)
+            
             # Resize the container to match the image size for proper scrolling
-            # Make sure the image label is at least as big as the pixmap
-            pixmap_width = display_pixmap.width()
-            pixmap_height = display_pixmap.height()
-            self.image_label.setMinimumSize(pixmap_width, pixmap_height)
+            # Make sure the image label is at least as big as the displayed image
+            display_size = self.image_label.display_size()
+            self.image_label.setMinimumSize(display_size)
             
             # Force a layout update to ensure proper positioning
             self.image_container_layout.update()
@@ -820,8 +1226,8 @@ class SkiMapProcessor(QMainWindow):
             if hasattr(self, 'original_pixmap'):
                 orig_width = self.original_pixmap.width()
                 orig_height = self.original_pixmap.height()
-                display_width = display_pixmap.width()
-                display_height = display_pixmap.height()
+                display_width = display_size.width()
+                display_height = display_size.height()
                 self.statusBar().showMessage(f"Image dimensions: {orig_width}x{orig_height} pixels | Display: {display_width}x{display_height} | Zoom: {int(self.current_zoom * 100)}%")
             
         except Exception as e:
@@ -834,8 +1240,7 @@ class SkiMapProcessor(QMainWindow):
             return
         
         current_folder = self.folders[self.current_folder_index]
-        folder_path = os.path.join(self.files_dir, current_folder)
-        metadata_path = os.path.join(folder_path, "metadata.json")
+        metadata_path = self.metadata_paths[self.current_folder_index]
         
         # Get values from form
         name = self.name_input.text()
@@ -889,81 +1294,68 @@ class SkiMapProcessor(QMainWindow):
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=4)
         
-        # Create redacted image if we have boxes and an original image
-        original_image_path = os.path.join(folder_path, "ski_map_original.png")
-        redacted_image_path = os.path.join(folder_path, "ski_map_redacted.png")
+        # Write through to the in-memory copy; boxes is the label's live list
+        self._metadata_cache[self.folders[self.current_folder_index]] = dict(metadata, boxes=[list(box) for box in boxes])
         
-        if boxes and os.path.exists(original_image_path):
-            try:
-                # Open the original image with PIL
-                pil_img = Image.open(original_image_path)
-                
-                # Create a drawing context
-                draw = ImageDraw.Draw(pil_img)
-                
-                # Draw filled rectangles for each box
-                for box in boxes:
-                    x, y, width, height = box
-                    # Ensure coordinates are within image bounds
-                    x = max(0, min(x, pil_img.width - 1))
-                    y = max(0, min(y, pil_img.height - 1))
-                    # Ensure width and height don't exceed image bounds
-                    width = min(width, pil_img.width - x)
-                    height = min(height, pil_img.height - y)
-                    # Draw the rectangle
-                    draw.rectangle([x, y, x + width, y + height], fill=(0, 0, 0))
-                
-                # Save the redacted image
-                pil_img.save(redacted_image_path)
-                
-                # Enable the view toggle button
-                self.view_toggle_btn.setEnabled(True)
-                
-                self.statusBar().showMessage(f"Metadata and redacted image saved for {current_folder}")
-            except Exception as e:
-                self.statusBar().showMessage(f"Error creating redacted image: {e}")
-                print(f"Error creating redacted image: {e}")
+        # Create (or remove) the redacted image in the background so saving doesn't block the UI
+        original_image_path = self.original_image_paths[self.current_folder_index]
+        redacted_image_path = self.redacted_image_paths[self.current_folder_index]
+        
+        if boxes and original_image_path.exists():
+            cached = self._image_cache.get(str(original_image_path))
+            task = RedactTask(original_image_path, redacted_image_path, boxes,
+                              image=cached[0] if cached else None)
+            self.statusBar().showMessage(f"Metadata saved for {current_folder} | Creating redacted image...")
         else:
             # If no boxes, remove any existing redacted image
-            if os.path.exists(redacted_image_path):
-                try:
-                    os.remove(redacted_image_path)
-                    self.view_toggle_btn.setEnabled(False)
-                except Exception as e:
-                    print(f"Error removing redacted image: {e}")
-            
+            task = RedactTask(original_image_path, redacted_image_path, [])
             self.statusBar().showMessage(f"Metadata saved for {current_folder}")
+        task.signals.finished.connect(self._on_redaction_finished)
+        self._redact_pool.start(task)
         
         print(f"Metadata saved for {current_folder}")
         
-        # Update unique values with new entries
-        if country and country not in self.unique_values["country"] and country != "Other":
-            self.unique_values["country"].append(country)
-            self.unique_values["country"].sort()
-            self.update_combo_items(self.country_combo, self.unique_values["country"])
+        # Update unique values with new entries (the lists are kept sorted)
+        if country and country != "Other":
+            self.add_combo_value(self.country_combo, self.unique_values["country"], country)
         
         # Update country-to-region mapping
         if country and region and region != "Other":
             if country not in self.country_to_regions:
                 self.country_to_regions[country] = []
             
-            if region not in self.country_to_regions[country]:
-                self.country_to_regions[country].append(region)
-                self.country_to_regions[country].sort()
-        
-        if company and company not in self.unique_values["parent_company"] and company != "Other":
-            self.unique_values["parent_company"].append(company)
-            self.unique_values["parent_company"].sort()
-            self.update_combo_items(self.company_combo, self.unique_values["parent_company"])
+            add_unique(self.country_to_regions[country], region)
+        
+        if company and company != "Other":
+            self.add_combo_value(self.company_combo, self.unique_values["parent_company"], company)
             
-        if continent and continent not in self.unique_values["continent"] and continent != "Other":
-            self.unique_values["continent"].append(continent)
-            self.unique_values["continent"].sort()
-            self.update_combo_items(self.continent_combo, self.unique_values["continent"])
+        if continent and continent != "Other":
+            self.add_combo_value(self.continent_combo, self.unique_values["continent"], continent)
             
         # Update the index.json file
         self.update_index_json()
     
+    def _on_redaction_finished(self, redacted_image_path, redacted_image, error):
+        """Report a finished RedactTask and update the view toggle if it was for the current folder"""
+        current = redacted_image_path == str(self.redacted_image_paths[self.current_folder_index])
+        
+        # The file was rewritten or removed, so any cached copy is stale; keep the new one instead
+        self._redacted_image_cache.pop(redacted_image_path, None)
+        if current and not redacted_image.isNull():
+            self._redacted_image_cache[redacted_image_path] = redacted_image
+        
+        if error:
+            print(f"Error updating redacted image {redacted_image_path}: {error}")
+            if current:
+                self.statusBar().showMessage(f"Error creating redacted image: {error}")
+            return
+        
+        if current:
+            # A null image means the task removed the redacted image rather than writing it
+            self.view_toggle_btn.setEnabled(not redacted_image.isNull())
+            if not redacted_image.isNull():
+                self.statusBar().showMessage(f"Metadata and redacted image saved for {self.folders[self.current_folder_index]}")
+    
     def update_index_json(self):
         """Create or update the index.json file with a list of all ski resort folders and their names"""
         index_path = os.path.join(self.files_dir, "index.json")
@@ -971,24 +1363,15 @@ class SkiMapProcessor(QMainWindow):
         # Create the index data structure
         ski_resorts = []
         
-        # Add each folder to the list with only the name
+        # Add each folder to the list with only the name, taken from the parsed metadata
+        # that _load_metadata and save_metadata keep in memory
         for folder in self.folders:
-            folder_path = os.path.join(self.files_dir, folder)
-            metadata_path = os.path.join(folder_path, "metadata.json")
-            
             resort_data = {"folderName": folder}
             
             # Add only the name if metadata exists
-            if os.path.exists(metadata_path):
-                try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                    
-                    # Add only the name to the index
-                    if metadata.get("name"):
-                        resort_data["name"] = metadata["name"]
-                except Exception as e:
-                    print(f"Error reading metadata from {metadata_path}: {e}")
+            metadata = self._metadata_cache.get(folder)
+            if metadata and metadata.get("name"):
+                resort_data["name"] = metadata["name"]
             
             ski_resorts.append(resort_data)
         
@@ -1009,12 +1392,16 @@ class SkiMapProcessor(QMainWindow):
             print(f"Error updating index file: {e}")
             self.statusBar().showMessage(f"Error updating index file: {e}")
     
-    def update_combo_items(self, combo, items):
-        """Update combo box items while preserving current selection"""
-        current_text = combo.currentText()
-        combo.clear()
-        combo.addItems([""] + items + ["Other"])
-        combo.setCurrentText(current_text)
+    def add_combo_value(self, combo, values, value):
+        """Add a value to a sorted unique-value list and insert it into the matching combo box"""
+        index = add_unique(values, value)
+        if index is not None:
+            # Insert just the new row (after the leading empty item) instead of rebuilding
+            # the whole list; the current selection is left untouched, and shifting its
+            # index must not re-run the change handler
+            combo.blockSignals(True)
+            combo.insertItem(index + 1, value)
+            combo.blockSignals(False)
     
     def next_folder(self):
         """Move to the next folder"""
@@ -1032,6 +1419,90 @@ class SkiMapProcessor(QMainWindow):
         self.current_folder_index = (self.current_folder_index - 1) % len(self.folders)
         self.load_current_folder()
 
+    def _get_scaled_pixmap(self, zoom, smooth=True):
+        """Get the original pixmap scaled to the given zoom level, reusing cached results
+        
+        With smooth=False a cache miss returns a quick preview and schedules a smooth re-render.
+        """
+        key = f"{self.current_image_key}@{round(zoom * 1000)}"
+        scaled_pixmap = QPixmapCache.find(key)
+        if scaled_pixmap is not None and not scaled_pixmap.isNull():
+            return scaled_pixmap
+        
+        # Scale from the smallest pyramid level that is still larger than the target; the
+        # fast preview only uses levels that already exist, building one is a smooth scale
+        source = self._pyramid_level(zoom, build=smooth)
+        
+        if not smooth:
+            self._smooth_timer.start()
+            return source.scaled(
+                int(self.original_width * zoom),
+                int(self.original_height * zoom),
+                Qt.KeepAspectRatio,
+                Qt.FastTransformation
+            )
+        
+        scaled_pixmap = source.scaled(
+            int(self.original_width * zoom),
+            int(self.original_height * zoom),
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+        QPixmapCache.insert(key, scaled_pixmap)
+        return scaled_pixmap
+    
+    def _pyramid_level(self, zoom, build=True):
+        """Get the smallest halved copy of the original pixmap that still covers the zoom level
+        
+        With build=False missing levels are not created and the deepest existing one is used.
+        """
+        level = 0
+        level_zoom = 1.0
+        source = self._pyramid[0]
+        while level_zoom / 2 >= zoom and min(source.width(), source.height()) >= 512:
+            level += 1
+            level_zoom /= 2
+            if level == len(self._pyramid):
+                if not build:
+                    break
+                self._pyramid.append(source.scaled(
+                    source.width() // 2,
+                    source.height() // 2,
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                ))
+            source = self._pyramid[level]
+        return source
+    
+    def _rerender_smooth(self):
+        """Replace the fast zoom preview with a smoothly scaled pixmap"""
+        if not hasattr(self, 'original_pixmap') or self.original_pixmap.isNull():
+            return
+        
+        self._display_current_zoom(smooth=True)
+        self.image_label.update()
+    
+    def _display_current_zoom(self, smooth=False):
+        """Display the original pixmap at the current zoom level"""
+        if self.current_zoom > 1.5:
+            # Scaling the whole map up would allocate zoom² times its memory, so only
+            # the visible region is painted instead
+            self.display_image(source_pixmap=self.original_pixmap)
+        else:
+            self.display_image(pixmap=self._get_scaled_pixmap(self.current_zoom, smooth=smooth))
+    
+    def _apply_zoom(self, zoom):
+        """Display the image at the given zoom level and rescale the boxes to match"""
+        self.current_zoom = zoom
+        
+        # Update the display (fast preview; smoothed once zooming settles)
+        self._display_current_zoom()
+        
+        # Update the boxes with the new scale
+        self.image_label.current_scale = self.current_zoom
+        self.image_label._update_scaled_boxes()
+        self.image_label.update()
+    
     def zoom_out(self):
         """Zoom out the image"""
         if not hasattr(self, 'original_pixmap') or self.original_pixmap.isNull():
@@ -1042,23 +1513,7 @@ class SkiMapProcessor(QMainWindow):
             return
             
         # Calculate new zoom level
-        self.current_zoom = max(0.1, self.current_zoom - self.zoom_step)
-        
-        # Scale the pixmap
-        scaled_pixmap = self.original_pixmap.scaled(
-            int(self.original_width * self.current_zoom),
-            int(self.original_height * self.current_zoom),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        
-        # Update the display
-        self.display_image(pixmap=scaled_pixmap)
-        
-        # Update the boxes with the new scale
-        self.image_label.current_scale = self.current_zoom
-        self.image_label._update_scaled_boxes()
-        self.image_label.update()
+        self._apply_zoom(max(0.1, self.current_zoom - self.zoom_step))
     
     def zoom_reset(self):
         """Reset the image to original size"""
@@ -1067,6 +1522,7 @@ class SkiMapProcessor(QMainWindow):
             
         # Set zoom to 100%
         self.current_zoom = 1.0
+        self._smooth_timer.stop()
         
         # Update the display with the original pixmap
         self.display_image(pixmap=self.original_pixmap)
@@ -1086,39 +1542,47 @@ class SkiMapProcessor(QMainWindow):
             return
             
         # Calculate new zoom level
-        self.current_zoom = min(5.0, self.current_zoom + self.zoom_step)
-        
-        # Scale the pixmap
-        scaled_pixmap = self.original_pixmap.scaled(
-            int(self.original_width * self.current_zoom),
-            int(self.original_height * self.current_zoom),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        
-        # Update the display
-        self.display_image(pixmap=scaled_pixmap)
-        
-        # Update the boxes with the new scale
-        self.image_label.current_scale = self.current_zoom
-        self.image_label._update_scaled_boxes()
-        self.image_label.update()
+        self._apply_zoom(min(5.0, self.current_zoom + self.zoom_step))
 
     def wheel_event(self, event):
         """Handle wheel events for zooming"""
         # Check if Ctrl key is pressed for zooming
         modifiers = QApplication.keyboardModifiers()
         if modifiers == Qt.ControlModifier:
-            # Zoom with Ctrl+wheel
-            if event.angleDelta().y() > 0:
-                self.zoom_in()
-            elif event.angleDelta().y() < 0:
-                self.zoom_out()
+            # Zoom with Ctrl+wheel; deltas are accumulated and applied at most once per frame
+            # so a fast scroll doesn't rescale the image for every tick
+            self._wheel_accum += event.angleDelta().y()
+            if not self._wheel_timer.isActive():
+                self._wheel_timer.start()
             event.accept()
         else:
             # Normal scrolling behavior
             QScrollArea.wheelEvent(self.image_scroll, event)
 
+    def _apply_wheel_zoom(self):
+        """Apply the wheel zoom steps accumulated since the last frame"""
+        # One zoom step per 120 units (one notch); keep any partial notch for later
+        steps = int(self._wheel_accum / 120)
+        self._wheel_accum -= steps * 120
+        
+        if steps == 0 or not hasattr(self, 'original_pixmap') or self.original_pixmap.isNull():
+            return
+        
+        # Step with the same limits as zoom_in/zoom_out so the wheel and the buttons
+        # reach the same range
+        zoom = self.current_zoom
+        for _ in range(abs(steps)):
+            if steps > 0:
+                if zoom >= 5.0:
+                    break
+                zoom = min(5.0, zoom + self.zoom_step)
+            else:
+                if zoom <= 0.2:
+                    break
+                zoom = max(0.1, zoom - self.zoom_step)
+        if zoom != self.current_zoom:
+            self._apply_zoom(zoom)
+    
     def toggle_draw_mode(self, checked):
         """Toggle drawing mode"""
         self.image_label.enable_drawing(checked)
@@ -1141,7 +1605,12 @@ class SkiMapProcessor(QMainWindow):
             if os.path.exists(self.redacted_image_path):
                 # Hide boxes before switching to redacted image
                 self.image_label.boxes_visible = False
-                self.display_image(image_path=self.redacted_image_path)
+                redacted_image = self._redacted_image_cache.get(self.redacted_image_path)
+                if redacted_image is None:
+                    redacted_image = QImage(self.redacted_image_path)
+                    if not redacted_image.isNull():
+                        self._redacted_image_cache[self.redacted_image_path] = redacted_image
+                self.display_image(image_path=self.redacted_image_path, image=redacted_image)
                 self.view_toggle_btn.setText("View Original")
                 self.statusBar().showMessage(f"Viewing redacted image")
             else:
@@ -1149,8 +1618,13 @@ class SkiMapProcessor(QMainWindow):
                 self.statusBar().showMessage(f"Redacted image not found")
         else:
             # Show original image
-            # First load the image
-            self.display_image(image_path=self.original_image_path)
+            # First load the image, reusing the decode kept in the image cache
+            cached = self._image_cache.get(self.original_image_path)
+            if cached:
+                image, fitted_image = cached
+                self.display_image(image_path=self.original_image_path, image=image, fitted_image=fitted_image)
+            else:
+                self.display_image(image_path=self.original_image_path)
             
             # Then make boxes visible again and update them with the current scale
             self.image_label.boxes_visible = True
@@ -1160,6 +1634,14 @@ class SkiMapProcessor(QMainWindow):
             
             self.view_toggle_btn.setText("View Redacted")
             self.statusBar().showMessage(f"Viewing original image")
+    
+    def closeEvent(self, event):
+        """Finish writing any pending redacted images and image loads before closing"""
+        self._redact_pool.waitForDone()
+        # A loader still running at interpreter teardown would emit on a deleted signals object
+        self._load_pool.clear()
+        self._load_pool.waitForDone()
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)